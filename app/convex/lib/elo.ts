@@ -4,13 +4,21 @@ const DIFFICULTY_RATINGS: Record<string, number> = {
   hard: 1400,
 };
 
+// 10 ** (d / 400) === e ** (d * ln(10) / 400); folded once at module load.
+const ELO_EXP_SCALE = Math.LN10 / 400;
+
+// Shared, frozen K-factor tiers so getKFactor never allocates per call.
+const PLACEMENT_K = Object.freeze({ k: 40, label: "Placement Match" });
+const HIGH_TIER_K = Object.freeze({ k: 16, label: "High-Tier Protection" });
+const STANDARD_K = Object.freeze({ k: 32, label: "Standard" });
+
 export function getKFactor(
   gamesPlayed: number,
   eloRating: number,
-): { k: number; label: string } {
-  if (gamesPlayed < 30) return { k: 40, label: "Placement Match" };
-  if (eloRating >= 2000) return { k: 16, label: "High-Tier Protection" };
-  return { k: 32, label: "Standard" };
+): { readonly k: number; readonly label: string } {
+  if (gamesPlayed < 30) return PLACEMENT_K;
+  if (eloRating >= 2000) return HIGH_TIER_K;
+  return STANDARD_K;
 }
 
 export function calculateEloChange(
@@ -21,7 +29,7 @@ export function calculateEloChange(
 ): number {
   const opponentRating = DIFFICULTY_RATINGS[difficulty] ?? 1200;
   const expected =
-    1 / (1 + Math.pow(10, (opponentRating - playerRating) / 400));
+    1 / (1 + Math.exp((opponentRating - playerRating) * ELO_EXP_SCALE));
   return Math.round(kFactor * (performanceScore - expected) * 10) / 10;
 }
 